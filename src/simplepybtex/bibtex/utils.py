@@ -488,6 +488,9 @@ def split_tex_string(string, sep=None, strip=True, filter_empty=False):
     """
 
     if sep is None:
+        if '{' not in string and '\\' not in string and '~' not in string:
+            # plain whitespace splitting: str.split beats the regex
+            return string.split()
         sep = BIBTEX_SPACE_RE
         filter_empty = True
 
@@ -22,6 +22,7 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import re
+from sys import intern
 from typing import Iterable, Tuple
 
 try:
@@ -29,8 +30,6 @@ try:
 except ImportError:
     from collections import Mapping
 
-import textwrap
-
 from simplepybtex.exceptions import PybtexError
 from simplepybtex.utils import (
     OrderedCaseInsensitiveDict, CaseInsensitiveDefaultDict, CaseInsensitiveSet
@@ -39,14 +38,6 @@ from simplepybtex.bibtex.utils import split_tex_string, scan_bibtex_string
 from simplepybtex.errors import report_error
 
 
-# for python2 compatibility
-def indent(text, prefix):
-    if hasattr(textwrap, "indent"):
-        return textwrap.indent(text, prefix)
-    else:
-        return ''.join(prefix + line for line in text.splitlines(True))
-
-
 class BibliographyDataError(PybtexError):
     pass
 
@@ -57,6 +48,15 @@ class InvalidNameString(PybtexError):
         super(InvalidNameString, self).__init__(message)
 
 
+def _want_any_entry(key):
+    """Stand-in for :py:meth:`BibliographyData.want_entry` when no filter is set.
+
+    A module-level function (rather than a lambda) so that
+    :py:class:`BibliographyData` instances remain picklable.
+    """
+    return True
+
+
 class BibliographyData(object):
     def __init__(self, entries=None, preamble=None, wanted_entries=None, min_crossrefs=2):
         """
@@ -90,9 +90,13 @@ class BibliographyData(object):
         if wanted_entries is not None:
             self.wanted_entries = CaseInsensitiveSet(wanted_entries)
             self.citations = CaseInsensitiveSet(wanted_entries)
+            self._wants_all = '*' in self.wanted_entries
         else:
             self.wanted_entries = None
             self.citations = CaseInsensitiveSet()
+            self._wants_all = False
+            # no filter: every entry is wanted, so skip the checks
+            self.want_entry = _want_any_entry
         if entries:
             if isinstance(entries, Mapping):
                 entries = entries.items()
@@ -110,17 +114,13 @@ class BibliographyData(object):
         )
 
     def __repr__(self):
-
-        repr_entry = repr(self.entries)
-        keys = self.entries.keys()
-
-        for key in keys:
-            ind = repr_entry.index(key) - 2  # find first instance
-            repr_entry = repr_entry[:ind] + "\n" + repr_entry[ind:]
-
-        repr_entry = indent(repr_entry, prefix="    ")
-        repr_entry = repr_entry[4:]  # drop 1st indent
-
+        repr_entry = '{0}([{1}])'.format(
+            type(self.entries).__name__,
+            ''.join(
+                '\n    ({0!r}, {1!r}),'.format(key, entry)
+                for key, entry in self.entries.items()
+            ),
+        )
         return (
             "BibliographyData(\n"
             "  entries={0},\n\n"
@@ -166,8 +166,8 @@ class BibliographyData(object):
     def want_entry(self, key):
         return (
             self.wanted_entries is None
+            or self._wants_all
             or key in self.wanted_entries
-            or '*' in self.wanted_entries
         )
 
     def get_canonical_key(self, key):
@@ -177,24 +177,47 @@ class BibliographyData(object):
             return key
 
     def add_entry(self, key, entry):
-        if not self.want_entry(key):
+        # This is the hottest loop of parsing: lowercase the key once and
+        # use the lowered-key fast paths of the case-insensitive containers.
+        lower_key = key.lower()
+        if self.wanted_entries is not None and not (
+            self._wants_all or self.wanted_entries._contains_lower(lower_key)
+        ):
             return
-        if key in self.entries:
+        if self.entries._contains_lower(lower_key):
             report_error(BibliographyDataError('repeated bibliography entry: %s' % key))
             return
-        entry.key = self.get_canonical_key(key)
+        entry.key = intern(self.citations._get_canonical_lower(lower_key, key))
         self.entries[entry.key] = entry
-        try:
-            crossref = entry.fields['crossref']
-        except KeyError:
-            pass
-        else:
-            if self.wanted_entries is not None:
+        if self.wanted_entries is not None and entry._fields is not None:
+            try:
+                crossref = entry._fields['crossref']
+            except KeyError:
+                pass
+            else:
                 self.wanted_entries.add(crossref)
+                if crossref == '*':  # pragma: no cover
+                    self._wants_all = True
 
     def add_entries(self, entries: Iterable[Tuple[str, "Entry"]]) -> None:
+        if self.wanted_entries is not None:
+            # Adding an entry may extend wanted_entries through its
+            # crossref field, so the filtering has to stay incremental.
+            for key, entry in entries:
+                self.add_entry(key, entry)
+            return
+        # Bulk path: no filtering, so inline add_entry with the
+        # per-item method dispatch and double lowering hoisted out.
+        contains_lower = self.entries._contains_lower
+        setitem_lower = self.entries._setitem_lower
+        get_canonical_lower = self.citations._get_canonical_lower
         for key, entry in entries:
-            self.add_entry(key, entry)
+            lower_key = key.lower()
+            if contains_lower(lower_key):
+                report_error(BibliographyDataError('repeated bibliography entry: %s' % key))
+                continue
+            entry.key = key = intern(get_canonical_lower(lower_key, key))
+            setitem_lower(lower_key, key, entry)
 
     def _get_crossreferenced_citations(self, citations, min_crossrefs):
         r"""
@@ -232,17 +255,21 @@ class BibliographyData(object):
 
         """
 
-        crossref_count = CaseInsensitiveDefaultDict(int)
-        citation_set = CaseInsensitiveSet(citations)
+        # probe the lowercase-keyed dicts directly, instead of lowering
+        # keys inside the CI containers per iteration
+        entries_lower = self.entries
+        crossref_count = {}
+        citation_set = {citation.lower() for citation in citations}
         for citation in citations:
-            try:
-                entry = self.entries[citation]
-                crossref = entry.fields['crossref']
-            except KeyError:
+            entry = dict.get(entries_lower, citation.lower())
+            if entry is None or entry._fields is None:
                 continue
-            try:
-                crossref_entry = self.entries[crossref]
-            except KeyError:
+            crossref = dict.get(entry._fields, 'crossref')
+            if crossref is None:
+                continue
+            crossref_lower = crossref.lower()
+            crossref_entry = dict.get(entries_lower, crossref_lower)
+            if crossref_entry is None:
                 report_error(BibliographyDataError(
                     'bad cross-reference: entry "{key}" refers to '
                     'entry "{crossref}" which does not exist.'.format(
@@ -251,11 +278,11 @@ class BibliographyData(object):
                 ))
                 continue
 
-            canonical_crossref = crossref_entry.key
-            crossref_count[canonical_crossref] += 1
-            if crossref_count[canonical_crossref] >= min_crossrefs and canonical_crossref not in citation_set:
-                citation_set.add(canonical_crossref)
-                yield canonical_crossref
+            count = crossref_count.get(crossref_lower, 0) + 1
+            crossref_count[crossref_lower] = count
+            if count >= min_crossrefs and crossref_lower not in citation_set:
+                citation_set.add(crossref_lower)
+                yield crossref_entry.key
 
     def _expand_wildcard_citations(self, citations):
         r"""
@@ -283,16 +310,25 @@ class BibliographyData(object):
 
         """
 
-        citation_set = CaseInsensitiveSet()
+        seen = set()
         for citation in citations:
             if citation == '*':
-                for key in self.entries:
-                    if key not in citation_set:
-                        citation_set.add(key)
+                if seen:
+                    for key in self.entries:
+                        lower_key = key.lower()
+                        if lower_key not in seen:
+                            seen.add(lower_key)
+                            yield key
+                else:
+                    # Nothing cited yet: entry keys are unique
+                    # case-insensitively, so every key is new.
+                    for key in self.entries:
+                        seen.add(key.lower())
                         yield key
             else:
-                if citation not in citation_set:
-                    citation_set.add(citation)
+                lower_key = citation.lower()
+                if lower_key not in seen:
+                    seen.add(lower_key)
                     yield citation
 
     def add_extra_citations(self, citations, min_crossrefs):
@@ -384,13 +420,28 @@ class BibliographyData(object):
 
         '''
 
-        entries_lower = ((key.lower(), entry.lower()) for key, entry in self.entries.items())
-        return type(self)(
-            entries=entries_lower,
+        if self.wanted_entries is not None:
+            # add_entry's filtering and canonicalization still apply
+            entries_lower = ((key.lower(), entry.lower()) for key, entry in self.entries.items())
+            return type(self)(
+                entries=entries_lower,
+                preamble=self._preamble,
+                wanted_entries=self.wanted_entries,
+                min_crossrefs=self.min_crossrefs,
+            )
+        # Fast path: the internal dict is already keyed by lowercase, so
+        # reuse its keys instead of lowering each key again just for
+        # add_entry to lower it once more.
+        data = type(self)(
             preamble=self._preamble,
-            wanted_entries=self.wanted_entries,
             min_crossrefs=self.min_crossrefs,
         )
+        setitem_lower = data.entries._setitem_lower
+        for lower_key, entry in self.entries.items_lower():
+            entry = entry.lower()
+            entry.key = lower_key
+            setitem_lower(lower_key, lower_key, entry)
+        return data
 
 
 class Entry(object):
@@ -402,28 +453,50 @@ class Entry(object):
     key = None
     """Entry key (for example, ``'fukushima1980neocognitron'``)."""
 
-    fields = None
-    """A dictionary of entry fields.
-    The dictionary is ordered and case-insensitive."""
-
-    persons = None
-    """
-    A dictionary of entry persons, by their roles.
-
-    The most often used roles are ``'author'`` and ``'editor'``.
-    """
+    _fields = None
+    _persons = None
 
     """A reference to the containing :py:class:`.BibliographyData` object. Used to resolve crossrefs."""
 
+    _crossref_cache = None
+    """A lazily created memo of fields resolved through the crossref chain."""
+
     def __init__(self, type_, fields=None, persons=None):
-        if fields is None:
-            fields = {}
-        if persons is None:
-            persons = {}
         self.type = type_.lower()
         self.original_type = type_
-        self.fields = OrderedCaseInsensitiveDict(fields)
-        self.persons = OrderedCaseInsensitiveDict(persons)
+        # crossref stubs have neither fields nor persons; the dicts are
+        # created lazily so that such entries stay cheap to construct
+        if fields:
+            self._fields = OrderedCaseInsensitiveDict(fields)
+        if persons:
+            self._persons = OrderedCaseInsensitiveDict(persons)
+
+    @property
+    def fields(self):
+        """A dictionary of entry fields.
+        The dictionary is ordered and case-insensitive."""
+        if self._fields is None:
+            self._fields = OrderedCaseInsensitiveDict()
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields):
+        self._fields = fields
+
+    @property
+    def persons(self):
+        """
+        A dictionary of entry persons, by their roles.
+
+        The most often used roles are ``'author'`` and ``'editor'``.
+        """
+        if self._persons is None:
+            self._persons = OrderedCaseInsensitiveDict()
+        return self._persons
+
+    @persons.setter
+    def persons(self, persons):
+        self._persons = persons
 
     def __eq__(self, other):
         if not isinstance(other, Entry):
@@ -472,14 +545,43 @@ class Entry(object):
         )
 
     def _find_person_field(self, role):
-        persons = self.persons[role]
-        return ' and '.join(str(person) for person in persons)
+        persons = self.persons.get(role)
+        if persons is None:
+            raise KeyError(role)
+        # a list comprehension instead of a genexp: str.join builds a
+        # list from the generator anyway, so skip the resumption cost
+        return ' and '.join([str(person) for person in persons])
 
     def _find_crossref_field(self, name, bib_data):
         if bib_data is None or 'crossref' not in self.fields:
             raise KeyError(name)
-        referenced_entry = bib_data.entries[self.fields['crossref']]
-        return referenced_entry._find_field(name, bib_data)
+        cache = self._crossref_cache
+        if cache is None:
+            cache = self._crossref_cache = {}
+        if name in cache:
+            return cache[name]
+        # Walk the crossref chain iteratively; the visited set guards
+        # against crossref cycles.
+        entry = self
+        visited = {id(self)}
+        while True:
+            try:
+                crossref = entry.fields['crossref']
+            except KeyError:
+                raise KeyError(name)
+            entry = bib_data.entries[crossref]
+            if id(entry) in visited:
+                raise KeyError(name)
+            visited.add(id(entry))
+            try:
+                value = entry.fields[name]
+            except KeyError:
+                persons = entry.persons.get(name)
+                if persons is None:
+                    continue
+                value = ' and '.join([str(person) for person in persons])
+            cache[name] = value
+            return value
 
     def _find_field(self, name, bib_data=None):
         """
@@ -496,13 +598,13 @@ class Entry(object):
           cross-referenced entry and try to find its field with the given
           ``name``.
         """
-        try:
-            return self.fields[name]
-        except KeyError:
-            try:
-                return self._find_person_field(name)
-            except KeyError:
-                return self._find_crossref_field(name, bib_data)
+        value = self.fields.get(name)
+        if value is not None:
+            return value
+        persons = self.persons.get(name)
+        if persons is not None:
+            return ' and '.join([str(person) for person in persons])
+        return self._find_crossref_field(name, bib_data)
 
     def to_string(self, bib_format, **kwargs):
         """
@@ -532,6 +634,189 @@ class Entry(object):
         return bibdata.entries[key]
 
 
+def _special_char_islower(special_char):
+    control_sequence = True
+    for char in special_char[1:]:  # skip the backslash
+        if control_sequence:
+            if not char.isalpha():
+                control_sequence = False
+        else:
+            if char.isalpha():
+                return char.islower()
+    return False
+
+
+def _is_von_name_uncached(string):
+    # ASCII fast path: two integer compares instead of Unicode
+    # property lookups, for the overwhelmingly common case.
+    first = ord(string[0])
+    if 65 <= first <= 90:  # A-Z
+        return False
+    if 97 <= first <= 122:  # a-z
+        return True
+    if string[0].isupper():
+        return False
+    if string[0].islower():
+        return True
+    else:
+        for char, brace_level in scan_bibtex_string(string):
+            if brace_level == 0 and char.isalpha():
+                return char.islower()
+            elif brace_level == 1 and char.startswith('\\'):
+                return _special_char_islower(char)
+    return False
+
+
+_NAME_SPECIAL_RE = re.compile(r'[{,~\\\s]')
+
+
+def _tokenize_name(name):
+    r"""Split a name at top-level commas and whitespace in a single pass.
+
+    Return a list of comma-separated segments, each a list of words.
+    Commas and whitespace at brace level > 0 are ignored, as in
+    :py:func:`~simplepybtex.bibtex.utils.split_tex_string`.
+
+    >>> _tokenize_name('Donald E. Knuth')
+    [['Donald', 'E.', 'Knuth']]
+    >>> _tokenize_name('Dixit, Jr, Avinash K.')
+    [['Dixit'], ['Jr'], ['Avinash', 'K.']]
+    >>> _tokenize_name('{Last, First}')
+    [['{Last, First}']]
+    >>> _tokenize_name('Viktorov, Michail~Markovitch')
+    [['Viktorov'], ['Michail', 'Markovitch']]
+    >>> _tokenize_name(r'Matsui\ Fuuka')
+    [['Matsui', 'Fuuka']]
+    >>> _tokenize_name(r'Qui\~{n}onero-Candela, J.')
+    [['Qui\\~{n}onero-Candela'], ['J.']]
+    >>> _tokenize_name('Last,')
+    [['Last'], []]
+    """
+    segments = [[]]
+    words = segments[0]
+    word_parts = []
+    pos = 0
+    end = len(name)
+    while pos < end:
+        match = _NAME_SPECIAL_RE.search(name, pos)
+        if match is None:
+            word_parts.append(name[pos:])
+            break
+        start = match.start()
+        if start > pos:
+            word_parts.append(name[pos:start])
+        pos = start
+        char = name[pos]
+        if char == '{':
+            depth = 1
+            last_brace = pos
+            pos += 1
+            while pos < end and depth:
+                c = name[pos]
+                if c == '{':
+                    depth += 1
+                    last_brace = pos
+                elif c == '}':
+                    depth -= 1
+                    last_brace = pos
+                pos += 1
+            if depth and last_brace > start:
+                # unbalanced: resume scanning after the last brace,
+                # like _find_closing_brace does
+                pos = last_brace + 1
+                word_parts.append(name[start:pos])
+            elif depth:
+                # the unclosed group runs to the end of the string; the
+                # old two-pass split stripped the segment tail first
+                word_parts.append(name[start:].rstrip())
+            else:
+                word_parts.append(name[start:pos])
+        elif char == '\\':
+            if pos + 1 < end and name[pos + 1] == ' ':
+                # "\ " is a control space, i.e. a word separator -- except
+                # when only whitespace follows up to a comma or the end of
+                # the string, which the old two-pass split stripped away
+                # before the pair could be recognized
+                j = pos + 2
+                while j < end and name[j].isspace():
+                    j += 1
+                if j >= end or name[j] == ',':
+                    word_parts.append(char)
+                    pos += 1
+                else:
+                    if word_parts:
+                        words.append(''.join(word_parts))
+                        del word_parts[:]
+                    pos += 2
+            else:
+                word_parts.append(char)
+                pos += 1
+        elif char == ',':
+            if word_parts:
+                words.append(''.join(word_parts))
+                del word_parts[:]
+            words = []
+            segments.append(words)
+            pos += 1
+        elif char == '~' and pos > 0 and name[pos - 1] == '\\':
+            # "\~" reached via a consumed "\\" pair is not a space
+            word_parts.append(char)
+            pos += 1
+        else:  # whitespace or "~"
+            if word_parts:
+                words.append(''.join(word_parts))
+                del word_parts[:]
+            pos += 1
+    if word_parts:
+        words.append(''.join(word_parts))
+    return segments
+
+
+class _LazyNameList(object):
+    """A data descriptor materializing an empty name-part list on first access.
+
+    Most :py:class:`Person` instances only ever populate one or two of the
+    five name-part lists, so the empty ones are not allocated up front.
+    """
+
+    def __init__(self, slot, doc=None):
+        self.slot = slot
+        self.__doc__ = doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if value is None:
+            value = []
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+
+_von_name_cache = {}
+_VON_NAME_CACHE_SIZE = 4096
+
+
+def _is_von_name(string):
+    """Memoized :py:func:`_is_von_name_uncached`.
+
+    The same name parts come up again and again in a bibliography, and the
+    non-ASCII cases need a full ``scan_bibtex_string`` tokenization, so the
+    result is cached per token (with FIFO eviction to bound memory use).
+    """
+    try:
+        return _von_name_cache[string]
+    except KeyError:
+        result = _is_von_name_uncached(string)
+        if len(_von_name_cache) >= _VON_NAME_CACHE_SIZE:
+            del _von_name_cache[next(iter(_von_name_cache))]
+        _von_name_cache[string] = result
+        return result
+
+
 class Person(object):
     """A person or some other person-like entity.
 
@@ -545,49 +830,48 @@ class Person(object):
 
     """
 
-    first_names = None
-    """
+    _first_names = None
+    _middle_names = None
+    _prelast_names = None
+    _last_names = None
+    _lineage_names = None
+
+    first_names = _LazyNameList('_first_names', """
     A list of first names.
 
     .. versionadded:: 0.19
         Earlier versions used :py:meth:`.first`, which is now deprecated.
-    """
+    """)
 
-    middle_names = None
-    """
+    middle_names = _LazyNameList('_middle_names', """
     A list of middle names.
 
     .. versionadded:: 0.19
         Earlier versions used :py:meth:`.middle`, which is now deprecated.
-    """
+    """)
 
-    prelast_names = None
-    """
+    prelast_names = _LazyNameList('_prelast_names', """
     A list of pre-last (aka von) name parts.
 
     .. versionadded:: 0.19
         Earlier versions used :py:meth:`.middle`, which is now deprecated.
-    """
+    """)
 
-    last_names = None
-    """
+    last_names = _LazyNameList('_last_names', """
     A list of last names.
 
     .. versionadded:: 0.19
         Earlier versions used :py:meth:`.last`, which is now deprecated.
-    """
+    """)
 
-    lineage_names = None
-    """
+    lineage_names = _LazyNameList('_lineage_names', """
     A list of linage (aka Jr) name parts.
 
     .. versionadded:: 0.19
         Earlier versions used :py:meth:`.lineage`, which is now deprecated.
-    """
+    """)
 
     valid_roles = ['author', 'editor']
-    style1_re = re.compile(r'^(.+),\s*(.+)$')
-    style2_re = re.compile(r'^(.+),\s*(.+),\s*(.+)$')
 
     def __init__(self, string="", first="", middle="", prelast="", last="", lineage=""):
         """
@@ -605,20 +889,19 @@ class Person(object):
 
         """
 
-        self.first_names = []
-        self.middle_names = []
-        self.prelast_names = []
-        self.last_names = []
-        self.lineage_names = []
-
         string = string.strip()
         if string:
             self._parse_string(string)
-        self.first_names.extend(split_tex_string(first))
-        self.middle_names.extend(split_tex_string(middle))
-        self.prelast_names.extend(split_tex_string(prelast))
-        self.last_names.extend(split_tex_string(last))
-        self.lineage_names.extend(split_tex_string(lineage))
+        if first:
+            self.first_names.extend(split_tex_string(first))
+        if middle:
+            self.middle_names.extend(split_tex_string(middle))
+        if prelast:
+            self.prelast_names.extend(split_tex_string(prelast))
+        if last:
+            self.last_names.extend(split_tex_string(last))
+        if lineage:
+            self.lineage_names.extend(split_tex_string(lineage))
 
     @property
     def bibtex_first_names(self):
@@ -633,7 +916,7 @@ class Person(object):
         >>> knuth.bibtex_first_names
         ['Donald', 'E.']
         """
-        return self.first_names + self.middle_names
+        return (self._first_names or []) + (self._middle_names or [])
 
     def _parse_string(self, name):
         """Extract various parts of the name from a string.
@@ -677,11 +960,11 @@ class Person(object):
         ['Michail'] ['Markovitch'] [] ['Viktorov'] []
         """
         def process_first_middle(parts):
-            try:
+            if parts:
                 self.first_names.append(parts[0])
-                self.middle_names.extend(parts[1:])
-            except IndexError:
-                pass
+                middle = parts[1:]
+                if middle:
+                    self.middle_names.extend(middle)
 
         def process_von_last(parts):
             # von cannot be the last name in the list
@@ -689,10 +972,13 @@ class Person(object):
             definitely_not_von = parts[-1:]
 
             if von_last:
-                von, last = rsplit_at(von_last, is_von_name)
-                self.prelast_names.extend(von)
-                self.last_names.extend(last)
-            self.last_names.extend(definitely_not_von)
+                von, last = rsplit_at(von_last, _is_von_name)
+                if von:
+                    self.prelast_names.extend(von)
+                if last:
+                    self.last_names.extend(last)
+            if definitely_not_von:
+                self.last_names.extend(definitely_not_von)
 
         def find_pos(lst, pred):
             for i, item in enumerate(lst):
@@ -709,76 +995,60 @@ class Person(object):
             pos = find_pos(lst, pred)
             return lst[:pos], lst[pos:]
 
+        def rfind_pos(lst, pred):
+            i = len(lst) - 1
+            while i >= 0 and not pred(lst[i]):
+                i -= 1
+            return i + 1
+
         def rsplit_at(lst, pred):
-            rpos = find_pos(reversed(lst), pred)
-            pos = len(lst) - rpos
+            pos = rfind_pos(lst, pred)
             return lst[:pos], lst[pos:]
 
-        def is_von_name(string):
-            if string[0].isupper():
-                return False
-            if string[0].islower():
-                return True
-            else:
-                for char, brace_level in scan_bibtex_string(string):
-                    if brace_level == 0 and char.isalpha():
-                        return char.islower()
-                    elif brace_level == 1 and char.startswith('\\'):
-                        return special_char_islower(char)
-            return False
-
-        def special_char_islower(special_char):
-            control_sequence = True
-            for char in special_char[1:]:  # skip the backslash
-                if control_sequence:
-                    if not char.isalpha():
-                        control_sequence = False
-                else:
-                    if char.isalpha():
-                        return char.islower()
-            return False
-
-        parts = split_tex_string(name, ',')
-        if len(parts) > 3:
+        segments = _tokenize_name(name)
+        if len(segments) > 3:
             report_error(InvalidNameString(name))
-            last_parts = parts[2:]
-            parts = parts[:2] + [' '.join(last_parts)]
-
-        if len(parts) == 3:  # von Last, Jr, First
-            process_von_last(split_tex_string(parts[0]))
-            self.lineage_names.extend(split_tex_string(parts[1]))
-            process_first_middle(split_tex_string(parts[2]))
-        elif len(parts) == 2:  # von Last, First
-            process_von_last(split_tex_string(parts[0]))
-            process_first_middle(split_tex_string(parts[1]))
-        elif len(parts) == 1:  # First von Last
-            parts = split_tex_string(name)
-            first_middle, von_last = split_at(parts, is_von_name)
+            # the merge joins the extra segments' text and re-splits it,
+            # applying the control-space rules across the joined
+            # boundaries; the single-pass tokenizer cannot reproduce
+            # that from its word lists, so this (cold, already-invalid)
+            # path redoes the split with the two-pass machinery
+            parts = split_tex_string(name, ',')
+            segments = [split_tex_string(part) for part in parts[:2]]
+            segments.append(split_tex_string(' '.join(parts[2:])))
+
+        if len(segments) == 3:  # von Last, Jr, First
+            process_von_last(segments[0])
+            if segments[1]:
+                self.lineage_names.extend(segments[1])
+            process_first_middle(segments[2])
+        elif len(segments) == 2:  # von Last, First
+            process_von_last(segments[0])
+            process_first_middle(segments[1])
+        else:  # First von Last
+            first_middle, von_last = split_at(segments[0], _is_von_name)
             if not von_last and first_middle:
                 last = first_middle.pop()
                 von_last.append(last)
             process_first_middle(first_middle)
             process_von_last(von_last)
-        else:
-            # should hot really happen
-            raise ValueError(name)  # pragma: no cover
 
     def __eq__(self, other):
         if not isinstance(other, Person):
             return super(Person, self) == other
         return (
-            self.first_names == other.first_names
-            and self.middle_names == other.middle_names
-            and self.prelast_names == other.prelast_names
-            and self.last_names == other.last_names
-            and self.lineage_names == other.lineage_names
+            (self._first_names or []) == (other._first_names or [])
+            and (self._middle_names or []) == (other._middle_names or [])
+            and (self._prelast_names or []) == (other._prelast_names or [])
+            and (self._last_names or []) == (other._last_names or [])
+            and (self._lineage_names or []) == (other._lineage_names or [])
         )
 
     def __str__(self):
         # von Last, Jr, First
-        von_last = ' '.join(self.prelast_names + self.last_names)
-        jr = ' '.join(self.lineage_names)
-        first = ' '.join(self.first_names + self.middle_names)
+        von_last = ' '.join((self._prelast_names or []) + (self._last_names or []))
+        jr = ' '.join(self._lineage_names or [])
+        first = ' '.join((self._first_names or []) + (self._middle_names or []))
         return ', '.join(part for part in (von_last, jr, first) if part)
 
     def __repr__(self):
@@ -19,8 +19,6 @@
 # TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-import io
-
 import simplepybtex.io
 from simplepybtex.database import BibliographyData
 from simplepybtex.exceptions import PybtexError
@@ -39,12 +37,11 @@ class BaseParser:
 
     def parse_file(self, filename):
         self.filename = filename
-        open_file = simplepybtex.io.open_unicode
-        with open_file(filename, encoding=self.encoding) as f:
-            try:
-                self.parse_stream(f)
-            except UnicodeDecodeError as e:  # pragma: no cover
-                raise PybtexError(str(e), filename=self.filename)
+        try:
+            text = simplepybtex.io.read_all_unicode(filename, encoding=self.encoding)
+        except UnicodeDecodeError as e:  # pragma: no cover
+            raise PybtexError(str(e), filename=self.filename)
+        self.parse_string(text)
         return self.data
 
     def parse_string(self, value):  # pragma: no cover
@@ -20,10 +20,11 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 from contextlib import contextmanager
+from contextvars import ContextVar
 
 strict = True
 error_code = 0
-captured_errors = None
+_captured_errors = ContextVar('captured_errors', default=None)
 
 
 def set_strict_mode(enable=True):
@@ -35,12 +36,14 @@ def set_strict_mode(enable=True):
 def capture():
     """Capture exceptions for debug purposes."""
 
-    global captured_errors
-    captured_errors = []
+    # a ContextVar instead of a module global, so that concurrent parse
+    # jobs each capture their own errors
+    errors = []
+    token = _captured_errors.set(errors)
     try:
-        yield captured_errors
+        yield errors
     finally:
-        captured_errors = None
+        _captured_errors.reset(token)
 
 
 def format_error(exception, prefix='ERROR: '):  # pragma: no cover
@@ -66,10 +69,14 @@ def print_error(exception, prefix='ERROR: '):  # pragma: no cover
 def report_error(exception):
     global error_code
 
-    if captured_errors is not None:
-        captured_errors.append(exception)
+    captured = _captured_errors.get()
+    if captured is not None:
+        captured.append(exception)
         return
 
+    # the uncaptured path is cold -- it raises or prints -- so read the
+    # public strict flag per call; assigning errors.strict directly has
+    # to keep working
     if strict:  # pragma: no cover
         raise exception
     else:  # pragma: no cover
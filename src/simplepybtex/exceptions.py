@@ -21,6 +21,8 @@
 
 
 class PybtexError(Exception):
+    _str_cache = None
+
     def __init__(self, message, filename=None):
         super(PybtexError, self).__init__(message)
         self.filename = filename
@@ -37,8 +39,18 @@ class PybtexError(Exception):
             from .io import _decode_filename
             return _decode_filename(self.filename, errors='replace')
 
+    def _cached_str(self):
+        # str(self) can be arbitrarily involved in subclasses (e.g.
+        # PybtexSyntaxError formats line context); compute it only once
+        cached = self._str_cache
+        if cached is None:
+            cached = self._str_cache = str(self)
+        return cached
+
     def __eq__(self, other):
-        return str(self) == str(other)
+        if isinstance(other, PybtexError):
+            return self._cached_str() == other._cached_str()
+        return self._cached_str() == str(other)
 
     def __hash__(self):  # pragma: no cover
-        return hash(str(self))
+        return hash(self._cached_str())
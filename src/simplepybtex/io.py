@@ -23,6 +23,7 @@
 """Unicode-aware IO routines."""
 
 import io
+import os
 import posixpath
 import sys
 from os import environ
@@ -42,16 +43,24 @@ def get_stream_encoding(stream):
 def _decode_filename(filename, errors='strict'):
     """Decode byte-encoded filename."""
 
+    if errors == 'strict':
+        # C-implemented, caches the filesystem encoding and round-trips
+        # undecodable bytes via surrogateescape
+        return os.fsdecode(filename)
     encoding = sys.getfilesystemencoding() or get_default_encoding()
     return filename.decode(encoding, errors=errors)
 
 
 def _open_existing(opener, filename, mode, locate, **kwargs):
-    if not posixpath.isfile(filename):
+    # try the path as given first instead of stat()-ing it beforehand:
+    # in the common case the file is right there and one syscall suffices
+    try:
+        return opener(filename, mode, **kwargs)
+    except FileNotFoundError:
         found = locate(filename)
         if found:
-            filename = found
-    return opener(filename, mode, **kwargs)
+            return opener(found, mode, **kwargs)
+        raise
 
 
 def _open_or_create(opener, filename, mode, environ, **kwargs):
@@ -79,14 +88,32 @@ def _open(opener, filename_or_file, mode, **kwargs):
         raise PybtexError("unable to open %s. %s" % (filename, error.strerror))
 
 
-def open_raw(filename, mode='rb', encoding=None):
-    return _open(io.open, filename, mode)
+# BibTeX files are scanned sequentially; a buffer well above
+# io.DEFAULT_BUFFER_SIZE keeps the syscall count down
+_BUFFER_SIZE = 256 * 1024
+
+
+def open_raw(filename, mode='rb', encoding=None, buffering=_BUFFER_SIZE):
+    return _open(io.open, filename, mode, buffering=buffering)
+
+
+def open_unicode(filename, mode='r', encoding=None, buffering=_BUFFER_SIZE):
+    if encoding is None:
+        encoding = get_default_encoding()
+    return _open(io.open, filename, mode, buffering=buffering, encoding=encoding)
+
 
+def read_all_unicode(filename, encoding=None):
+    """Read a whole file into a string, decoding it in one go.
 
-def open_unicode(filename, mode='r', encoding=None):
+    One bulk ``read()`` plus a single decode of a contiguous bytes object
+    is faster than decoding incrementally through a ``TextIOWrapper``.
+    """
     if encoding is None:
         encoding = get_default_encoding()
-    return _open(io.open, filename, mode, encoding=encoding)
+    with open_raw(filename) as f:
+        data = f.read()
+    return data.decode(encoding)
 
 
 def reader(stream, encoding=None, errors='strict'):
@@ -22,22 +22,53 @@
 
 """Miscellaneous small utils."""
 import itertools
-from collections import OrderedDict
+import sys
+from itertools import chain
+from sys import intern
 try:
-    from collections.abc import MutableMapping, MutableSet, Sequence
+    from collections.abc import Mapping, MutableSet
 except ImportError:  # pragma: no cover
-    from collections import MutableMapping, MutableSet, Sequence
+    from collections import Mapping, MutableSet
 
-from itertools import zip_longest
 
+if sys.version_info >= (3, 10):
+    def pairwise(iterable):
+        """Yield (item, next item) pairs, ending with (last item, None)."""
+        return itertools.pairwise(chain(iterable, [None]))
+else:  # pragma: no cover
+    from itertools import zip_longest
 
-def pairwise(iterable):
-    a, b = itertools.tee(iterable)
-    next(b, None)
-    return zip_longest(a, b)
+    def pairwise(iterable):
+        """Yield (item, next item) pairs, ending with (last item, None)."""
+        a, b = itertools.tee(iterable)
+        next(b, None)
+        return zip_longest(a, b)
 
 
-class CaseInsensitiveDict(MutableMapping):
+_MISSING = object()
+
+_key_pair_cache = {}
+_KEY_PAIR_CACHE_SIZE = 4096
+
+
+def _intern_key_pair(key):
+    """Return ``(key.lower(), key)`` with both strings interned.
+
+    Field names, entry types and person roles repeat endlessly across a
+    database; memoizing the pair skips the ``.lower()`` call and the
+    intern-table probes for keys that were already seen.  The cache is
+    bounded so arbitrary entry keys cannot grow it without limit.
+    """
+    pair = _key_pair_cache.get(key)
+    if pair is None:
+        if len(_key_pair_cache) >= _KEY_PAIR_CACHE_SIZE:
+            del _key_pair_cache[next(iter(_key_pair_cache))]
+        key = intern(key)
+        pair = _key_pair_cache[key] = (intern(key.lower()), key)
+    return pair
+
+
+class CaseInsensitiveDict(dict):
     """A dict with case-insensitive lookup.
 
     >>> d = CaseInsensitiveDict(TesT='passed')
@@ -97,49 +128,252 @@ class CaseInsensitiveDict(MutableMapping):
     ... )
     CaseInsensitiveDict({'a': 'b'})
 
+    Comparisons ignore key case:
+
+    >>> d = CaseInsensitiveDict(TesT='passed')
+    >>> d == {'TesT': 'passed'}
+    True
+    >>> d == {'TEST': 'passed'}
+    True
+    >>> d == CaseInsensitiveDict(TEST='passed')
+    True
+    >>> d == {'test': 'failed'}
+    False
+    >>> d != {'Test': 'passed'}
+    False
+    >>> d == 'TesT: passed'
+    False
+    >>> d != 'TesT: passed'
+    True
+
+    >>> d = CaseInsensitiveDict(Uno=1)
+    >>> d.update(UNO='one', Dos=2)
+    >>> d['uno'], d['dos']
+    ('one', 2)
+    >>> list(d.keys())
+    ['UNO', 'Dos']
+    >>> d.pop('DOS')
+    2
+    >>> d.pop('missing', 'default')
+    'default'
+    >>> d.pop('missing')
+    Traceback (most recent call last):
+        ...
+    KeyError: 'missing'
+    >>> d.popitem()
+    ('UNO', 'one')
+    >>> d['Tres'] = 3
+    >>> d.copy()
+    CaseInsensitiveDict({'Tres': 3})
+    >>> d.clear()
+    >>> d.items()
+    []
+    >>> len(d)
+    0
+
+    The union operators lower keys and preserve the type, like update():
+
+    >>> d = CaseInsensitiveDict(Uno=1)
+    >>> d |= {'DOS': 2}
+    >>> list(d.keys())
+    ['Uno', 'DOS']
+    >>> d['dos']
+    2
+    >>> e = d | {'Tres': 3}
+    >>> e
+    CaseInsensitiveDict({'Uno': 1, 'DOS': 2, 'Tres': 3})
+    >>> type(e) is CaseInsensitiveDict
+    True
+    >>> {'Cuatro': 4} | d
+    CaseInsensitiveDict({'Cuatro': 4, 'Uno': 1, 'DOS': 2})
+    >>> d | [('pair', 5)]
+    Traceback (most recent call last):
+        ...
+    TypeError: unsupported operand type(s) for |: 'CaseInsensitiveDict' and 'list'
+
     """
 
     def __init__(self, *args, **kwargs):
-        initial = dict(*args, **kwargs)
-        self._dict = dict((key.lower(), value) for key, value in initial.items())
-        self._keys = dict((key.lower(), key) for key in initial)
-
-    def __len__(self):
-        return len(self._dict)
+        # The dict itself is keyed by the lowered key; a parallel dict
+        # remembers the canonical spelling for display.  Subclassing dict
+        # directly lets __len__, __bool__ and pickling run at C speed
+        # instead of going through the MutableMapping mixins.
+        # Keys are interned: field names, person roles and entry keys come
+        # from a small vocabulary that is repeated across many entries, so
+        # sharing one string object per name saves memory and makes dict
+        # lookups hit the pointer-equality fast path.
+        if len(args) == 1 and not kwargs and isinstance(args[0], Mapping):
+            src = args[0].items()
+        else:
+            src = dict(*args, **kwargs).items()
+        self._keys = keys = {}
+        setitem = dict.__setitem__
+        for key, value in src:
+            lower_key, key = _intern_key_pair(key)
+            setitem(self, lower_key, value)
+            keys[lower_key] = key
 
     def __iter__(self):
         return iter(self._keys.values())
 
     def __setitem__(self, key, value):
         """To implement lowercase keys."""
-        key_lower = key.lower()
-        self._dict[key_lower] = value
-        self._keys[key_lower] = key
+        lower_key, key = _intern_key_pair(key)
+        dict.__setitem__(self, lower_key, value)
+        self._keys[lower_key] = key
 
     def __getitem__(self, key):
-        return self._dict[key.lower()]
+        # probe with the key as given first: internal callers mostly pass
+        # the canonical lowercase key, making .lower() a wasted allocation
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            value = dict.get(self, key.lower(), _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            value = dict.get(self, key.lower(), _MISSING)
+            if value is _MISSING:
+                return default
+        return value
 
     def __delitem__(self, key):
-        key_lower = key.lower()
-        del self._dict[key_lower]
-        del self._keys[key_lower]
+        lower_key = key if dict.__contains__(self, key) else key.lower()
+        dict.__delitem__(self, lower_key)
+        del self._keys[lower_key]
 
     def __contains__(self, key):
-        return key.lower() in self._dict
+        return dict.__contains__(self, key) or dict.__contains__(self, key.lower())
+
+    def __eq__(self, other):
+        # mappings compare equal if their items match ignoring key case;
+        # two CI dicts compare at C speed since both are lowercase-keyed
+        if isinstance(other, CaseInsensitiveDict):
+            return dict.__eq__(self, other)
+        if isinstance(other, Mapping):
+            if len(other) != len(self):
+                return False
+            return dict.__eq__(self, {
+                key.lower(): value for key, value in other.items()
+            })
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return NotImplemented
+        return not equal
+
+    def _contains_lower(self, lower_key):
+        """Like ``in``, for a key that is already lowercase."""
+        return dict.__contains__(self, lower_key)
+
+    def _setitem_lower(self, lower_key, key, value):
+        """Like ``__setitem__``, with the lowercase key precomputed."""
+        lower_key = intern(lower_key)
+        dict.__setitem__(self, lower_key, value)
+        self._keys[lower_key] = intern(key)
+
+    def setdefault(self, key, default=None):
+        # dict.setdefault would bypass __setitem__ and miss self._keys
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            lower_key = key.lower()
+            value = dict.get(self, lower_key, _MISSING)
+            if value is _MISSING:
+                value = default
+                dict.__setitem__(self, intern(lower_key), value)
+                self._keys[intern(lower_key)] = intern(key)
+        return value
+
+    def update(self, *args, **kwargs):
+        # dict.update would bypass __setitem__ and miss self._keys
+        if len(args) == 1 and not kwargs and isinstance(args[0], Mapping):
+            src = args[0].items()
+        else:
+            src = dict(*args, **kwargs).items()
+        for key, value in src:
+            self[key] = value
+
+    def pop(self, key, default=_MISSING):
+        # dict.pop would bypass __delitem__ and miss self._keys
+        lower_key = key if dict.__contains__(self, key) else key.lower()
+        value = dict.pop(self, lower_key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        del self._keys[lower_key]
+        return value
+
+    def popitem(self):
+        lower_key, value = dict.popitem(self)
+        return self._keys.pop(lower_key), value
+
+    def __ior__(self, other):
+        # dict.__ior__ would bypass __setitem__ and miss self._keys
+        self.update(other)
+        return self
+
+    def __or__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        result = self.copy()
+        result.update(other)
+        return result
+
+    def __ror__(self, other):
+        # called even for plain-dict left operands, since this class is a
+        # dict subclass overriding the reflected operator
+        if not isinstance(other, Mapping):
+            return NotImplemented  # pragma: no cover
+        # go through copy() so subclasses with extra constructor
+        # arguments (CaseInsensitiveDefaultDict) keep working
+        result = self.copy()
+        result.clear()
+        result.update(other)
+        result.update(self.items())
+        return result
+
+    def clear(self):
+        dict.clear(self)
+        self._keys.clear()
+
+    def copy(self):
+        # dict.copy would return a plain dict of the lowered keys
+        return type(self)(self.items())
+
+    def keys(self):
+        return list(self._keys.values())
+
+    def items(self):
+        get = dict.__getitem__
+        return [
+            (key, get(self, lower_key))
+            for lower_key, key in self._keys.items()
+        ]
 
     def __repr__(self):
         """A caselessDict version of __repr__ """
-        dct = dict((key, self[key]) for key in self)
+        dct = dict(self.items())
         return '{0}({1})'.format(
             type(self).__name__, repr(dct),
         )
 
     def items_lower(self):
-        return ((key.lower(), value) for key, value in self.items())
+        return dict.items(self)
 
     def lower(self):
         return type(self)(self.items_lower())
 
+    def __reduce__(self):
+        # dict's default pickling restores the items before the instance
+        # state, i.e. before self._keys exists; rebuild through __init__
+        return type(self), (self.items(),)
+
 
 class CaseInsensitiveDefaultDict(CaseInsensitiveDict):
     """CaseInseisitiveDict with default factory, like collections.defaultdict
@@ -158,6 +392,11 @@ class CaseInsensitiveDefaultDict(CaseInsensitiveDict):
     >>> d['B'] += 10
     >>> d['b']
     10
+    >>> e = d.copy()
+    >>> e['b']
+    10
+    >>> e.default_factory is d.default_factory
+    True
 
     """
     def __init__(self, default_factory):
@@ -165,10 +404,22 @@ class CaseInsensitiveDefaultDict(CaseInsensitiveDict):
         self.default_factory = default_factory
 
     def __getitem__(self, key):
-        try:
-            return super(CaseInsensitiveDefaultDict, self).__getitem__(key)
-        except KeyError:
-            return self.default_factory()
+        # probe instead of catching KeyError: misses are the common case
+        # here and raising is far costlier than a failed dict.get
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            value = dict.get(self, key.lower(), _MISSING)
+            if value is _MISSING:
+                return self.default_factory()
+        return value
+
+    def copy(self):
+        copied = type(self)(self.default_factory)
+        copied.update(self.items())
+        return copied
+
+    def __reduce__(self):
+        return type(self), (self.default_factory,), None, None, iter(self.items())
 
 
 class OrderedCaseInsensitiveDict(CaseInsensitiveDict):
@@ -239,11 +490,6 @@ class OrderedCaseInsensitiveDict(CaseInsensitiveDict):
     ['one', 3, 'four']
     """
 
-    def __init__(self, *args, **kwargs):
-        initial = OrderedDict(*args, **kwargs)
-        self._dict = dict((key.lower(), value) for key, value in initial.items())
-        self._keys = OrderedDict((key.lower(), key) for key in initial)
-
     def __repr__(self):
         return '{0}({1})'.format(
             type(self).__name__, list(self.items()),
@@ -304,12 +550,17 @@ class CaseInsensitiveSet(MutableSet):
     def __init__(self, iterable=()):
         self._set = set()
         self._keys = dict()
+        self._sorted_cache = None
         for item in iterable:
             self.add(item)
 
     def __contains__(self, key):
         return key.lower() in self._set
 
+    def _contains_lower(self, lower_key):
+        """Like ``in``, for a key that is already lowercase."""
+        return lower_key in self._set
+
     def __iter__(self):
         return iter(self._set)
 
@@ -318,22 +569,36 @@ class CaseInsensitiveSet(MutableSet):
 
     def __repr__(self):
         """A caselessDict version of __repr__ """
+        # sorting is O(N log N) per call; memoize it until the next
+        # mutation, since repr() tends to be called repeatedly on
+        # unchanged sets
+        cached = self._sorted_cache
+        if cached is None:
+            cached = self._sorted_cache = sorted(self._keys.values())
         return '{0}({1})'.format(
-            type(self).__name__, repr(sorted(self._keys.values()))
+            type(self).__name__, repr(cached)
         )
 
     def add(self, key):
-        key_lower = key.lower()
+        # intern like the CI dicts do: the same few entry keys and field
+        # names recur constantly, so share one string object per spelling
+        key_lower = intern(key.lower())
         self._set.add(key_lower)
-        self._keys[key_lower] = key
+        self._keys[key_lower] = intern(key)
+        self._sorted_cache = None
 
     def discard(self, key):
         key_lower = key.lower()
         self._set.discard(key_lower)
         self._keys.pop(key_lower, None)
+        self._sorted_cache = None
 
     def get_canonical_key(self, key):
         return self._keys[key.lower()]
 
+    def _get_canonical_lower(self, lower_key, default=None):
+        """Like :py:meth:`get_canonical_key`, for a key that is already lowercase."""
+        return self._keys.get(lower_key, default)
+
     def lower(self):
         return type(self)(self._set)
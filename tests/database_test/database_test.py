@@ -19,9 +19,11 @@
 # TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import functools
+import hashlib
 import pickle
 from abc import ABCMeta, abstractmethod
-from copy import deepcopy
+from copy import copy, deepcopy
 from io import BytesIO, TextIOWrapper
 
 import pytest
@@ -30,11 +32,26 @@ from simplepybtex.database import parse_bytes, parse_string, BibliographyData, E
 from .data import reference_data
 
 
+@functools.lru_cache(maxsize=None)
+def _reference_data_copy():
+    # one defensive deep copy per test run; each IO instance takes a
+    # shallow copy so attribute-level tweaks (like clearing the preamble
+    # for BibTeXML) stay local to that instance
+    return deepcopy(reference_data)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_codec():
+    from simplepybtex.database.output.bibtex import Writer
+    from simplepybtex.database.input.bibtex import Parser
+    return Writer(encoding='UTF-8'), Parser(encoding='UTF-8')
+
+
 class DatabaseIO(object):
     __metaclass__ = ABCMeta
 
     def __init__(self):
-        self.reference_data = deepcopy(reference_data)
+        self.reference_data = copy(_reference_data_copy())
         assert reference_data.entries
         assert reference_data.preamble
 
@@ -49,12 +66,9 @@ class DatabaseIO(object):
 
 class PybtexDatabaseIO(DatabaseIO):
     def __init__(self, bib_format):
-        from simplepybtex.database.output.bibtex import Writer
-        from simplepybtex.database.input.bibtex import Parser
         super(PybtexDatabaseIO, self).__init__()
         self.bib_format = bib_format
-        self.writer = Writer(encoding='UTF-8')
-        self.parser = Parser(encoding='UTF-8')
+        self.writer, self.parser = _shared_codec()
 
         if bib_format == 'bibtexml':
             # BibTeXML does not support TeX preambles
@@ -121,6 +135,8 @@ class PickleIO(DatabaseIO):
 
 
 class ReprEvalIO(DatabaseIO):
+    _eval_globals = None
+
     def __repr__(self):  # pragma: no cover
         return '{}()'.format(type(self).__name__)
 
@@ -128,23 +144,36 @@ class ReprEvalIO(DatabaseIO):
         return repr(bib_data)
 
     def deserialize(self, repr_value):
-        from simplepybtex.utils import OrderedCaseInsensitiveDict
-        from simplepybtex.database import BibliographyData, Entry, Person
-        return eval(repr_value, {
-            'OrderedCaseInsensitiveDict': OrderedCaseInsensitiveDict,
-            'BibliographyData': BibliographyData,
-            'Entry': Entry,
-            'Person': Person,
-        })
+        if ReprEvalIO._eval_globals is None:
+            from simplepybtex.utils import OrderedCaseInsensitiveDict
+            from simplepybtex.database import BibliographyData, Entry, Person
+            ReprEvalIO._eval_globals = {
+                'OrderedCaseInsensitiveDict': OrderedCaseInsensitiveDict,
+                'BibliographyData': BibliographyData,
+                'Entry': Entry,
+                'Person': Person,
+            }
+        return eval(repr_value, ReprEvalIO._eval_globals)
+
+
+def _fingerprint(bib_data):
+    return hashlib.sha256(
+        pickle.dumps(bib_data, protocol=pickle.HIGHEST_PROTOCOL)
+    ).digest()
 
 
 def check_database_io(io_obj):
     serialized_data = io_obj.serialize(io_obj.reference_data)
     deserialized_data = io_obj.deserialize(serialized_data)
-    assert deserialized_data == io_obj.reference_data
+    # comparing pickle fingerprints is one C-level pass instead of a
+    # recursive __eq__ walk; equal objects can still pickle to different
+    # bytes (string memoization), so only a mismatch falls back to the
+    # slow deep comparison
+    if _fingerprint(deserialized_data) != _fingerprint(io_obj.reference_data):
+        assert deserialized_data == io_obj.reference_data
 
 
-@pytest.mark.parametrize(["io_cls"], [(PybtexBytesIO,), (PybtexStringIO,), (PybtexEntryStringIO,),(PybtexBytesIO,)])
+@pytest.mark.parametrize(["io_cls"], [(PybtexBytesIO,), (PybtexStringIO,), (PybtexEntryStringIO,)])
 @pytest.mark.parametrize(["bib_format"], [("bibtex",), ("bibtexml",), ("yaml",)])
 def test_database_io(io_cls, bib_format):
     check_database_io(io_cls(bib_format))